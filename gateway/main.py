@@ -1,7 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from prometheus_fastapi_instrumentator import Instrumentator
 import httpx
+import hashlib
 import uvicorn
 import os
 import logging
@@ -20,6 +22,9 @@ app = FastAPI(title="MusicBrainz API Gateway", version="1.0.0")
 # Add Prometheus instrumentation
 Instrumentator().instrument(app).expose(app)
 
+# Compress larger JSON responses (recommendation lists, artist listings) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Service URLs
 ARTIST_SERVICE_URL = os.getenv("ARTIST_SERVICE_URL", "http://localhost:8001")
 ALBUM_SERVICE_URL = os.getenv("ALBUM_SERVICE_URL", "http://localhost:8002")
@@ -33,11 +38,33 @@ TIMEOUT_CONFIG = httpx.Timeout(
     pool=10.0       # 10 seconds to get connection from pool
 )
 
+def project_recommendations(payload, fields):
+    """Keep only the comma-separated fields of each recommendation; an empty fields string keeps everything"""
+    if not fields:
+        return payload
+    keep = set(fields.split(","))
+    payload["recommendations"] = [
+        {key: value for key, value in rec.items() if key in keep}
+        for rec in payload.get("recommendations", [])
+    ]
+    return payload
+
+class ArtistBatchRequest(BaseModel):
+    """Request body model for batched artist lookups"""
+    ids: list = []
+    fields: list = []
+
 class ProfileCreate(BaseModel):
     """Request body model for creating/updating user profiles"""
     favorite_genres: list = []
     favorite_artists: list = []
 
+class ListeningHistoryItem(BaseModel):
+    """Request body item for batched listening history entries"""
+    track_id: str
+    artist_id: str
+    interaction_type: str = "played"
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy", "service": "api-gateway"}
@@ -58,6 +85,22 @@ async def search_artists(query: str, limit: int = 25):
         logger.error(f"Artist service error: {e}")
         raise HTTPException(status_code=503, detail=ARTIST_SERVICE_UNAVAILABLE)
 
+@app.post("/api/artists/batch")
+async def get_artists_batch(batch: ArtistBatchRequest):
+    try:
+        async with httpx.AsyncClient(timeout=TIMEOUT_CONFIG) as client:
+            response = await client.post(f"{ARTIST_SERVICE_URL}/artists/batch", json=batch.model_dump())
+            if response.status_code == 200:
+                return response.json()
+            raise HTTPException(status_code=response.status_code, detail=SERVICE_UNAVAILABLE)
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=504, detail=ARTIST_SERVICE_TIMEOUT)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch artist error: {e}")
+        raise HTTPException(status_code=503, detail=ARTIST_SERVICE_UNAVAILABLE)
+
 @app.get("/api/artists/{artist_id}")
 async def get_artist(artist_id: str):
     try:
@@ -73,12 +116,16 @@ async def get_artist(artist_id: str):
         raise HTTPException(status_code=503, detail=ARTIST_SERVICE_UNAVAILABLE)
 
 @app.get("/api/artists")
-async def list_artists(skip: int = 0, limit: int = 100):
+async def list_artists(request: Request, skip: int = 0, limit: int = 100):
     try:
         async with httpx.AsyncClient(timeout=TIMEOUT_CONFIG) as client:
             response = await client.get(f"{ARTIST_SERVICE_URL}/artists", params={"skip": skip, "limit": limit})
             if response.status_code == 200:
-                return response.json()
+                # Let clients revalidate with If-None-Match and skip the body when nothing changed
+                etag = f'"{hashlib.blake2b(response.content, digest_size=16).hexdigest()}"'
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag})
+                return Response(content=response.content, media_type="application/json", headers={"ETag": etag})
             raise HTTPException(status_code=response.status_code, detail=SERVICE_UNAVAILABLE)
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail=ARTIST_SERVICE_TIMEOUT)
@@ -118,7 +165,7 @@ async def get_album(album_id: str):
 
 # Recommendation endpoints with enhanced error handling
 @app.get("/api/recommendations/query")
-async def get_query_recommendations(query: str, limit: int = 10):
+async def get_query_recommendations(query: str, limit: int = 10, fields: str = ""):
     try:
         logger.info(f"Gateway: Getting recommendations for '{query}' with limit {limit}")
         
@@ -139,7 +186,7 @@ async def get_query_recommendations(query: str, limit: int = 10):
             logger.info(f"Gateway: Recommendation service responded with status {response.status_code}")
             
             if response.status_code == 200:
-                return response.json()
+                return project_recommendations(response.json(), fields)
             elif response.status_code == 400:
                 raise HTTPException(status_code=400, detail="Invalid query parameters")
             elif response.status_code == 404:
@@ -177,13 +224,13 @@ async def get_profile_recommendations(username: str, limit: int = 10):
         raise HTTPException(status_code=503, detail="Profile service unavailable")
 
 @app.get("/api/recommendations/similar/{artist_name}")
-async def get_similar_recommendations(artist_name: str, limit: int = 10):
+async def get_similar_recommendations(artist_name: str, limit: int = 10, fields: str = ""):
     try:
         async with httpx.AsyncClient(timeout=TIMEOUT_CONFIG) as client:
             response = await client.get(f"{RECOMMENDATION_SERVICE_URL}/recommendations/similar/{artist_name}", 
                                       params={"limit": limit})
             if response.status_code == 200:
-                return response.json()
+                return project_recommendations(response.json(), fields)
             else:
                 raise HTTPException(status_code=response.status_code, detail="Similar recommendations service error")
     except httpx.TimeoutException:
@@ -260,6 +307,24 @@ async def add_listening_history(username: str, track_id: str, artist_id: str, in
         logger.error(f"Add history error: {e}")
         raise HTTPException(status_code=503, detail="History service unavailable")
 
+@app.post("/api/users/{username}/listening-history/batch")
+async def add_listening_history_batch(username: str, entries: list[ListeningHistoryItem]):
+    try:
+        async with httpx.AsyncClient(timeout=TIMEOUT_CONFIG) as client:
+            response = await client.post(f"{RECOMMENDATION_SERVICE_URL}/users/{username}/listening-history/batch",
+                                       json=[entry.model_dump() for entry in entries])
+            if response.status_code == 200:
+                return response.json()
+            else:
+                raise HTTPException(status_code=response.status_code, detail="History service error")
+    except HTTPException:
+        raise
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=504, detail="History service timeout")
+    except Exception as e:
+        logger.error(f"Add history batch error: {e}")
+        raise HTTPException(status_code=503, detail="History service unavailable")
+
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -10,6 +10,9 @@ import random
 
 API_GATEWAY = "http://localhost:8000"
 
+# One keep-alive connection to the gateway, like the UI's pooled session
+session = requests.Session()
+
 # Sample queries to rotate through
 QUERIES = [
     "rock music",
@@ -33,7 +36,7 @@ ARTISTS = [
 def make_request(endpoint, params):
     """Make a request and return status"""
     try:
-        response = requests.get(f"{API_GATEWAY}{endpoint}", params=params, timeout=30)
+        response = session.get(f"{API_GATEWAY}{endpoint}", params=params, timeout=30)
         return response.status_code
     except Exception as e:
         print(f"Error: {e}")
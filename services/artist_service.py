@@ -8,6 +8,7 @@
 
 from fastapi import FastAPI, Depends, HTTPException
 from sqlalchemy.orm import Session
+from pydantic import BaseModel
 from shared.database import get_db  # Remove create_tables import
 from shared.models import Artist, Album
 from services.musicbrainz_service import MusicBrainzService
@@ -65,6 +66,73 @@ def search_artists(query: str, limit: int = 25, db: Session = Depends(get_db)):
         logger.error(f"Error in search_artists: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+def artist_to_dict(artist):
+    """Serialize an Artist row the way the artist detail endpoints return it"""
+    return {
+        "id": artist.id,
+        "name": artist.name,
+        "sort_name": artist.sort_name,
+        "type": artist.type,
+        "country": artist.country,
+        "begin_date": artist.begin_date,
+        "end_date": artist.end_date
+    }
+
+def store_artist(artist_data: dict, db: Session):
+    """Add an Artist row built from a MusicBrainz artist record (caller commits)"""
+    artist = Artist(
+        id=artist_data['id'],
+        name=artist_data['name'],
+        sort_name=artist_data.get('sort-name', ''),
+        type=artist_data.get('type', ''),
+        country=artist_data.get('country', ''),
+        begin_date=artist_data.get('life-span', {}).get('begin', ''),
+        end_date=artist_data.get('life-span', {}).get('end', '')
+    )
+    db.add(artist)
+    return artist
+
+def fetch_and_store_artist(artist_id: str, db: Session):
+    """Fetch an artist missing from the local DB from MusicBrainz and save it; None if MusicBrainz has no match"""
+    artist_data = musicbrainz.get_artist(artist_id)
+    if not artist_data:
+        return None
+    
+    artist = store_artist(artist_data, db)
+    db.commit()
+    return artist
+
+class ArtistBatch(BaseModel):
+    """Request body model for fetching several artists at once"""
+    ids: list = []
+    fields: list = []  # artist_to_dict keys to return; empty means all of them
+
+@app.post("/artists/batch")
+def get_artists_batch(batch: ArtistBatch, db: Session = Depends(get_db)):
+    """Get several artists in one call: one local DB query, then one MusicBrainz search for the IDs not stored yet"""
+    try:
+        ids = list(dict.fromkeys(batch.ids))
+        artists = {a.id: artist_to_dict(a) for a in db.query(Artist).filter(Artist.id.in_(ids)).all()}
+        
+        # A single rate-limited search covers every missing ID instead of one lookup (and delay) per artist
+        missing = [artist_id for artist_id in ids if artist_id not in artists]
+        if missing:
+            wanted = set(missing)
+            for artist_data in musicbrainz.get_artists(missing):
+                if artist_data['id'] in wanted and artist_data['id'] not in artists:
+                    artists[artist_data['id']] = artist_to_dict(store_artist(artist_data, db))
+            db.commit()
+        
+        if batch.fields:
+            artists = {
+                artist_id: {field: artist[field] for field in batch.fields if field in artist}
+                for artist_id, artist in artists.items()
+            }
+        return {"artists": artists}
+    except Exception as e:
+        logger.error(f"Error in get_artists_batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @app.get("/artists/{artist_id}")
 def get_artist(artist_id: str, db: Session = Depends(get_db)):
     """Get artist from local DB or fetch from MusicBrainz"""
@@ -73,33 +141,12 @@ def get_artist(artist_id: str, db: Session = Depends(get_db)):
         artist = db.query(Artist).filter(Artist.id == artist_id).first()
         
         if not artist:
-            # Fetch from MusicBrainz
-            artist_data = musicbrainz.get_artist(artist_id)
-            if not artist_data:
+            # Fetch from MusicBrainz and save to DB
+            artist = fetch_and_store_artist(artist_id, db)
+            if not artist:
                 raise HTTPException(status_code=404, detail="Artist not found")
-            
-            # Save to DB
-            artist = Artist(
-                id=artist_data['id'],
-                name=artist_data['name'],
-                sort_name=artist_data.get('sort-name', ''),
-                type=artist_data.get('type', ''),
-                country=artist_data.get('country', ''),
-                begin_date=artist_data.get('life-span', {}).get('begin', ''),
-                end_date=artist_data.get('life-span', {}).get('end', '')
-            )
-            db.add(artist)
-            db.commit()
         
-        return {
-            "id": artist.id,
-            "name": artist.name,
-            "sort_name": artist.sort_name,
-            "type": artist.type,
-            "country": artist.country,
-            "begin_date": artist.begin_date,
-            "end_date": artist.end_date
-        }
+        return artist_to_dict(artist)
     except HTTPException:
         raise
     except Exception as e:
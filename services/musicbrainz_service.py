@@ -51,6 +51,20 @@ class MusicBrainzService:
         params = {'inc': include}
         return self._make_request(f'artist/{artist_id}', params)
     
+    def get_artists(self, artist_ids: List[str]) -> List[Dict]:
+        """Get several artists by ID with one search request per 100 IDs instead of one lookup each"""
+        artists = []
+        for start in range(0, len(artist_ids), 100):  # 100 is the search page size cap
+            chunk = artist_ids[start:start + 100]
+            params = {
+                'query': ' OR '.join(f'arid:{artist_id}' for artist_id in chunk),
+                'limit': len(chunk)
+            }
+            result = self._make_request('artist', params)
+            if result:
+                artists.extend(result.get('artists', []))
+        return artists
+    
     def get_release(self, release_id: str, include: str = "recordings") -> Optional[Dict]:
         """Get release (album) details by ID"""
         params = {'inc': include}
@@ -3,6 +3,7 @@ Unit tests for Artist Service
 """
 
 import pytest
+from unittest.mock import patch
 from shared.models import Artist
 
 class TestArtistService:
@@ -42,6 +43,43 @@ class TestArtistService:
         assert len(data["artists"]) == 1
         assert data["artists"][0]["name"] == "Test Artist"
     
+    def test_get_artists_batch(self, artist_client, test_db, sample_artist_data):
+        """Test batch lookup returns stored artists keyed by ID"""
+        test_db.add(Artist(**sample_artist_data))
+        test_db.commit()
+
+        response = artist_client.post("/artists/batch", json={"ids": ["test-artist-123", "test-artist-123"]})
+        assert response.status_code == 200
+        artists = response.json()["artists"]
+        assert list(artists) == ["test-artist-123"]
+        assert artists["test-artist-123"]["country"] == "US"
+        assert artists["test-artist-123"]["begin_date"] == "1990-01-01"
+
+    def test_get_artists_batch_returns_requested_fields(self, artist_client, test_db, sample_artist_data):
+        """Test batch lookup trims each artist to the requested fields"""
+        test_db.add(Artist(**sample_artist_data))
+        test_db.commit()
+
+        response = artist_client.post(
+            "/artists/batch",
+            json={"ids": ["test-artist-123"], "fields": ["country", "begin_date", "end_date"]}
+        )
+        assert response.status_code == 200
+        assert set(response.json()["artists"]["test-artist-123"]) == {"country", "begin_date", "end_date"}
+
+    def test_get_artists_batch_fetches_missing_in_one_search(self, artist_client, test_db):
+        """Test IDs not in the DB are looked up with a single MusicBrainz call and stored"""
+        mb_artist = {"id": "mb-artist-1", "name": "MB Artist", "country": "GB", "life-span": {"begin": "1970"}}
+        with patch("services.artist_service.musicbrainz") as mock_mb:
+            mock_mb.get_artists.return_value = [mb_artist]
+            response = artist_client.post("/artists/batch", json={"ids": ["mb-artist-1", "mb-artist-2"]})
+
+        assert response.status_code == 200
+        mock_mb.get_artists.assert_called_once_with(["mb-artist-1", "mb-artist-2"])
+        mock_mb.get_artist.assert_not_called()
+        assert response.json()["artists"]["mb-artist-1"]["country"] == "GB"
+        assert test_db.query(Artist).filter(Artist.id == "mb-artist-1").count() == 1
+
     def test_get_artist_not_found(self, artist_client):
         """Test getting non-existent artist"""
         response = artist_client.get("/artists/nonexistent-id")
@@ -1,10 +1,67 @@
 import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
+def mock_upstream(response):
+    """Patch the gateway's httpx.AsyncClient so every upstream call returns response"""
+    client = MagicMock()
+    client.__aenter__.return_value = client
+    client.get = AsyncMock(return_value=response)
+    client.post = AsyncMock(return_value=response)
+    return patch("gateway.main.httpx.AsyncClient", return_value=client)
+
 def test_gateway_health():
     """Test gateway health endpoint"""
     from gateway.main import app
     client = TestClient(app)
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json()["status"] == "healthy"
\ No newline at end of file
+    assert response.json()["status"] == "healthy"
+
+def test_project_recommendations_keeps_requested_fields():
+    """Test that field projection trims each recommendation to the requested keys"""
+    from gateway.main import project_recommendations
+    payload = {
+        "recommendations": [{"track_id": "t1", "score": 90, "search_method": "tag"}],
+        "query_analyzed": {"detected_genre": "jazz"}
+    }
+    result = project_recommendations(payload, "track_id,score")
+    assert result["recommendations"] == [{"track_id": "t1", "score": 90}]
+    assert result["query_analyzed"] == {"detected_genre": "jazz"}
+    assert project_recommendations({"recommendations": [{"a": 1}]}, "") == {"recommendations": [{"a": 1}]}
+
+def test_listening_history_batch_keeps_upstream_error_status():
+    """Test that a non-200 from the recommendation service is passed through, not turned into a 503"""
+    from gateway.main import app
+    client = TestClient(app)
+    entries = [{"track_id": "t1", "artist_id": "a1", "interaction_type": "liked"}]
+    with mock_upstream(httpx.Response(404, json={"detail": "User not found"})):
+        response = client.post("/api/users/alice/listening-history/batch", json=entries)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "History service error"
+
+def test_list_artists_revalidates_with_etag():
+    """Test that /api/artists sets an ETag and answers a matching If-None-Match with an empty 304"""
+    from gateway.main import app
+    client = TestClient(app)
+    with mock_upstream(httpx.Response(200, json=[{"id": "a1", "name": "Artist One"}])):
+        first = client.get("/api/artists")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.json() == [{"id": "a1", "name": "Artist One"}]
+        
+        unchanged = client.get("/api/artists", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["etag"] == etag
+        
+        stale = client.get("/api/artists", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.headers["etag"] == etag
+    
+    with mock_upstream(httpx.Response(200, json=[{"id": "a2", "name": "Artist Two"}])):
+        changed = client.get("/api/artists", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json() == [{"id": "a2", "name": "Artist Two"}]
@@ -43,7 +43,24 @@ class TestRecommendationService:
                 params={"query": "test", "limit": limit}
             )
             assert response.status_code == 200
-    
+
+    @pytest.mark.parametrize("limit,expected", [(50, 50), (51, 10)])
+    def test_query_recommendations_limit_window(self, recommendation_client, limit, expected):
+        """Test limits up to MAX_RECOMMENDATIONS pass through and larger ones fall back to the default"""
+        with patch('services.recommendation_service.get_diverse_recommendations') as mock_rec:
+            mock_rec.return_value = {
+                "recommendations": [],
+                "query_analyzed": {},
+                "algorithm_version": "test"
+            }
+
+            response = recommendation_client.get(
+                "/recommendations/query",
+                params={"query": "test", "limit": limit}
+            )
+            assert response.status_code == 200
+            mock_rec.assert_called_once_with("test", expected)
+
     def test_create_profile_new_user(self, recommendation_client):
         """Test creating a new user profile"""
         profile_data = {
@@ -69,6 +86,22 @@ class TestRecommendationService:
         data = response.json()
         assert data["favorite_genres"] == []
         assert data["favorite_artists"] == []
+    
+    def test_listening_history_batch(self, recommendation_client, test_db):
+        """Test batched listening history entries are stored in one request"""
+        from shared.models import ListeningHistory
+        
+        entries = [
+            {"track_id": "track-1", "artist_id": "artist-1", "interaction_type": "liked"},
+            {"track_id": "track-2", "artist_id": "artist-2", "interaction_type": "saved"}
+        ]
+        
+        response = recommendation_client.post("/users/batchuser/listening-history/batch", json=entries)
+        
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        stored = test_db.query(ListeningHistory).order_by(ListeningHistory.track_id).all()
+        assert [(h.track_id, h.interaction_type) for h in stored] == [("track-1", "liked"), ("track-2", "saved")]
 
 class TestGenreDetection:
     """Test genre detection logic"""